@@ -6,6 +6,28 @@ Responsibilities:
     - Application state management
     - Interface between the model (Catalog) and the view (MainApp)
 """
+import re
+from collections import defaultdict
+
+# Characters the search index tokenizer splits on; a query word holding
+# any of them can never equal a whole indexed token
+_NON_TOKEN_CHAR = re.compile(r"[^a-z0-9]")
+
+
+def _user_liked_genres(user):
+    """Return the user's liked genres, or an empty tuple."""
+    return getattr(user, 'liked_genres', None) or ()
+
+
+def _user_favorites(user):
+    """Return the user's favorite movie ids, or an empty tuple."""
+    return getattr(user, 'favorites', None) or ()
+
+
+def _user_watched(user):
+    """Return the user's watched movie ids, or an empty tuple."""
+    return getattr(user, 'watched', None) or ()
+
 
 class MovieController:
     """
@@ -30,7 +52,57 @@ class MovieController:
         self.catalog = catalog
         self._current_filter = None
         self._current_search = ""
-    
+        self._search_index = self._build_search_index()
+        self._reco_cache = {}
+        self._by_director = self._build_director_index()
+        self._by_system_name = {
+            movie.system_name: movie for movie in catalog.get_all_catalog()
+        }
+        self._all_genres = tuple(catalog.get_all_genres())
+        self._view_cache = {}
+        self._group_cache = {}
+        self._full_grouped = None
+        self._full_grouped_count = -1
+        self._favorites_cache = (None, None)
+
+    def _build_director_index(self):
+        """
+        Build an index mapping each director to their movies.
+
+        Built once so recommendation requests look up favorite directors
+        directly instead of re-splitting every movie's director string.
+
+        Returns:
+            dict: Mapping of director name to list of Movie objects
+        """
+        by_director = defaultdict(list)
+        for movie in self.catalog.get_all_catalog():
+            if getattr(movie, 'director', None):
+                for director in movie.director.split(','):
+                    by_director[director.strip()].append(movie)
+        return dict(by_director)
+
+    def _build_search_index(self):
+        """
+        Build a lowercase token index over titles and directors.
+
+        Maps each token to the set of movie indices containing it, so a
+        search only scans the (much smaller) token vocabulary instead of
+        every movie's full title and director strings.
+
+        Returns:
+            dict: Mapping of lowercase token to set of catalog indices
+        """
+        index = defaultdict(set)
+        for i, movie in enumerate(self.catalog.get_all_catalog()):
+            text = movie.title.lower()
+            if movie.director:
+                text += " " + movie.director.lower()
+            for token in re.split(r"[^a-z0-9]+", text):
+                if token:
+                    index[token].add(i)
+        return dict(index)
+
     def get_all_movies(self):
         """
         Return all movies from the catalog.
@@ -51,21 +123,51 @@ class MovieController:
             list: Movies matching the search, or all movies if query is empty
         """
         self._current_search = query.strip()
-        
+
         if not self._current_search:
             return self.get_all_movies()
-        
-        # Use method that searches in both title and director
-        return self.catalog.get_movies_by_title_or_director(self._current_search)
+
+        # The view layer re-runs the active search on redraws and resizes;
+        # identical queries are answered from the cache
+        cache_key = self._current_search.lower()
+        cached = self._view_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        words = cache_key.split()
+
+        # Very short keywords match almost every token, and words with
+        # characters the tokenizer strips (hyphens, apostrophes, accents —
+        # e.g. "spider-man", "amélie") can never match a whole token; the
+        # plain substring scan keeps identical results in both cases
+        if any(len(word) < 2 or _NON_TOKEN_CHAR.search(word) for word in words):
+            results = self.catalog.get_movies_by_title_or_director(self._current_search)
+        else:
+            # Match each keyword against the token index instead of scanning
+            # every movie's title and director strings
+            matched_indices = set()
+            for word in words:
+                for token, indices in self._search_index.items():
+                    if word in token:
+                        matched_indices |= indices
+
+            movies = self.catalog.get_all_catalog()
+            results = [movies[i] for i in sorted(matched_indices)]
+
+        self._view_cache[cache_key] = results
+        return results
     
     def get_available_genres(self):
         """
-        Return the list of all available genres (without duplicates).
-        
+        Return all available genres (without duplicates).
+
+        The catalog doesn't change during a session, so the sorted result
+        is computed once at construction and reused.
+
         Returns:
-            list: Sorted list of unique genres
+            tuple: Sorted tuple of unique genres
         """
-        return list(self.catalog.get_all_genres())
+        return self._all_genres
     
     def get_movies_grouped_by_genre(self, movie_list=None):
         """
@@ -79,17 +181,37 @@ class MovieController:
             dict: Dictionary with genres as keys and lists of movies as values
         """
         if movie_list is None:
-            movie_list = self.get_all_movies()
-        
-        grouped = {}
-        
+            # Whole-catalog grouping is a copy of the prebuilt index,
+            # materialized once per catalogue size so home-view redraws
+            # reuse the same dict instead of re-copying every bucket.
+            # Callers must not mutate the returned lists.
+            if self._full_grouped_count != len(self.catalog.movies):
+                self._full_grouped = {
+                    genre: list(movies)
+                    for genre, movies in self.catalog.get_genre_index().items()
+                }
+                self._full_grouped_count = len(self.catalog.movies)
+            return self._full_grouped
+
+        # Resizes and view reloads regroup the same list repeatedly; the
+        # system_name tuple identifies the list's exact contents and order
+        cache_key = tuple(movie.system_name for movie in movie_list)
+        cached = self._group_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        grouped = defaultdict(list)
+        seen = defaultdict(set)
+
         for movie in movie_list:
+            system_name = movie.system_name
             for genre in movie.genres:
-                if genre not in grouped:
-                    grouped[genre] = []
-                if movie not in grouped[genre]:
+                if system_name not in seen[genre]:
+                    seen[genre].add(system_name)
                     grouped[genre].append(movie)
-        
+
+        grouped = dict(grouped)
+        self._group_cache[cache_key] = grouped
         return grouped
     
     def get_movie_count(self):
@@ -112,13 +234,10 @@ class MovieController:
             set: Set of director names from favorite movies
         """
         favorite_directors = set()
-        
-        if not hasattr(user, 'favorites') or not user.favorites:
-            return favorite_directors
-        
-        for movie_id in user.favorites:
-            movie = self.catalog.get_movie_by_system_name(movie_id)
-            if movie and hasattr(movie, 'director') and movie.director:
+
+        for movie_id in _user_favorites(user):
+            movie = self._by_system_name.get(movie_id)
+            if movie and movie.director:
                 directors = [d.strip() for d in movie.director.split(',')]
                 favorite_directors.update(directors)
         
@@ -139,35 +258,50 @@ class MovieController:
         if not user:
             print("No user provided for recommendations.")
             return []
-        
-        if not hasattr(user, 'liked_genres') and not user.liked_genres and not hasattr(user, 'favorites') and not user.favorites :
+
+        liked_genres = _user_liked_genres(user)
+        favorites = _user_favorites(user)
+        watched = _user_watched(user)
+
+        if not liked_genres and not favorites:
             print("User has no liked genres and no favorites films so no recommendation posible")
             return []
-        
+
+        # Reuse the previous result when the inputs haven't changed:
+        # the signature captures everything the recommendation depends on
+        signature = (
+            frozenset(liked_genres),
+            frozenset(favorites),
+            frozenset(watched)
+        )
+        if signature in self._reco_cache:
+            return self._reco_cache[signature]
+
         # Get movies based on liked genres
-        recommended_movies = self.catalog.get_movies_from_multiple_genres(user.liked_genres)
+        recommended_movies = self.catalog.get_movies_from_multiple_genres(liked_genres)
         
         # Get directors from favorite movies using the helper function
         favorite_directors = self._get_favorite_directors(user)
         
-        # Add movies from favorite directors
+        # Add movies from favorite directors via the prebuilt index,
+        # deduplicating through a set instead of scanning the result list
         if favorite_directors:
-            all_movies = self.catalog.get_all_catalog()
-            for movie in all_movies:
-                if movie not in recommended_movies and hasattr(movie, 'director') and movie.director:
-                    movie_directors = [d.strip() for d in movie.director.split(',')]
-                    # Check if any director matches
-                    if any(director in favorite_directors for director in movie_directors):
+            recommended_set = {movie.system_name for movie in recommended_movies}
+            for director in favorite_directors:
+                for movie in self._by_director.get(director, ()):
+                    if movie.system_name not in recommended_set:
+                        recommended_set.add(movie.system_name)
                         recommended_movies.append(movie)
         
         # Exclude watched movies
-        if hasattr(user, 'watched') and user.watched:
-            watched_set = set(user.watched)
+        if watched:
+            watched_set = set(watched)
             recommended_movies = [
                 movie for movie in recommended_movies 
                 if movie.system_name not in watched_set
             ]
-        
+
+        self._reco_cache[signature] = recommended_movies
         return recommended_movies
     
     def get_favorite_movies(self, user):
@@ -182,15 +316,23 @@ class MovieController:
         """
         if not user or not user.favorites:
             return []
-        
-        favorite_movies = []
-        for movie_id in user.favorites:
-            movie = self.catalog.get_movie_by_system_name(movie_id)
-            if movie:
-                favorite_movies.append(movie)
-        
-        return favorite_movies
-    
+
+        # The favorites view re-resolves this list on every like toggle
+        # and delayed reload; reuse the result while the user's list is
+        # unchanged
+        cache_key = (user.username, tuple(user.favorites))
+        cached_key, cached_result = self._favorites_cache
+        if cache_key == cached_key:
+            return cached_result
+
+        result = [
+            movie for movie in
+            (self._by_system_name.get(movie_id) for movie_id in user.favorites)
+            if movie is not None
+        ]
+        self._favorites_cache = (cache_key, result)
+        return result
+
     def get_wathclist_movie(self, user):
         """
         Return a list of the user's watchlist movies.
@@ -203,14 +345,12 @@ class MovieController:
         """
         if not user or not user.watchlist:
             return []
-        
-        watchlist_movies = []
-        for movie_id in user.watchlist:
-            movie = self.catalog.get_movie_by_system_name(movie_id)
-            if movie:
-                watchlist_movies.append(movie)
-        
-        return watchlist_movies
+
+        return [
+            movie for movie in
+            (self._by_system_name.get(movie_id) for movie_id in user.watchlist)
+            if movie is not None
+        ]
 
     def get_watched_movie(self, user):
         """
@@ -224,14 +364,12 @@ class MovieController:
         """
         if not user or not user.watched:
             return []
-        
-        watched_movies = []
-        for movie_id in user.watched:
-            movie = self.catalog.get_movie_by_system_name(movie_id)
-            if movie:
-                watched_movies.append(movie)
-        
-        return watched_movies
+
+        return [
+            movie for movie in
+            (self._by_system_name.get(movie_id) for movie_id in user.watched)
+            if movie is not None
+        ]
 
 
 
@@ -1,7 +1,11 @@
 import sys
 import os
-from PyQt6.QtWidgets import QApplication, QMainWindow, QMenu
-from PyQt6.QtCore import QTimer
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from PyQt6.QtWidgets import QApplication, QMainWindow, QMenu, QWidget
+from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QPixmap, QAction, QIcon
 
 from ui import Ui_MainWindow
@@ -10,9 +14,32 @@ from models import Catalog
 from user_manager import UserManager
 from user_manager.user_dialogs import show_login_dialog, confirm_logout, show_genre_preferences_dialog
 from widgets.genre_row import GenreRow
-from widgets.card import createFilmCard
+from widgets.card import (ConnectionQueue, FilmCard, createFilmCard,
+                          prefetch_posters, refresh_cards_for_movie)
 from widgets.movie_detail_modal import MovieDetailModal
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _load_logo_pixmap():
+    """
+    Load and scale the header logo once.
+
+    The scaled pixmap is cached so window rebuilds don't re-read and
+    re-scale the image from disk.
+
+    Returns:
+        QPixmap: Logo scaled to the header size
+
+    Raises:
+        FileNotFoundError: If the logo asset is missing
+    """
+    if not os.path.exists("./assets/logo.png"):
+        raise FileNotFoundError("The file './assets/logo.png' is missing. Please make sure it exists.")
+    return QPixmap("./assets/logo.png").scaled(140, 40)
+
+
 class MainApp(QMainWindow, Ui_MainWindow):
     """
     Main view of the Netflux application.
@@ -22,12 +49,19 @@ class MainApp(QMainWindow, Ui_MainWindow):
         - Does NOT contain business logic (delegated to the controller)
     """
     
+    # Emitted (from the loader thread, delivered queued) once the
+    # catalogue CSV has been parsed
+    _catalogue_loaded = pyqtSignal()
+
     # ========== INITIALIZATION ==========
-    
+
     def __init__(self, catalogue):
         """Initialize the main application window."""
         super().__init__()
-        self.setupUi(self)  
+        # Set before setupUi: resize events fired during UI construction
+        # check this to know initialization hasn't finished
+        self.controller = None
+        self.setupUi(self)
         self.setWindowTitle("Netflux")
         self.setMinimumSize(1024, 768)
 
@@ -35,17 +69,12 @@ class MainApp(QMainWindow, Ui_MainWindow):
         icon = QIcon("./assets/logo_icon.png")
         self.setWindowIcon(icon)
         
-        # Load logo
-        if not os.path.exists("./assets/logo.png"):
-            pixmap = QPixmap("./assets/file_not_found.jpeg")
-            raise FileNotFoundError("The file './assets/logo.png' is missing. Please make sure it exists.")
-        else:
-            pixmap = QPixmap("./assets/logo.png")
-        self.logo.setPixmap(pixmap.scaled(140, 40))
+        # Load logo (scaled once, cached at module level)
+        self.logo.setPixmap(_load_logo_pixmap())
         
-        # Initialize managers and controllers
+        # Initialize managers and controllers (the user database is read
+        # on the startup loader thread, see start_catalogue_load)
         self.user_manager = UserManager()
-        self.user_manager.load_users()
         self.catalogue = catalogue
         self.controller = MovieController(catalogue)
         
@@ -53,6 +82,33 @@ class MainApp(QMainWindow, Ui_MainWindow):
         self.current_view = "home"
         self.current_view_mode = "genre"
         self.displayed_cards = []
+        self._genre_rows = []
+
+        # Cards reused across grid-view switches, keyed by movie id; a
+        # view change reparents pooled cards instead of recreating them
+        self._card_pool = {}
+        # Identity of the currently displayed view (mode, columns, movies);
+        # lets show_movies skip rebuilds that would change nothing
+        self._current_view_key = None
+        # The movie list currently on screen, reused by resize rebuilds
+        # instead of re-querying the controller
+        self._current_movie_list = None
+        self._last_column_count = None
+        self.detail_window = None
+
+        # Like updates arriving in the same event-loop turn are coalesced
+        # and applied in a single pass
+        self._pending_like_updates = {}
+        self._like_flush_scheduled = False
+
+        # Last (scroll-area width, columns) pair computed by
+        # _calculate_columns; repeated calls at the same width are free
+        self._columns_for_width = (None, None)
+
+        # Debounce timer so drag-resizing coalesces into one grid rebuild
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._do_resize_rebuild)
         
         # Initialize display
         self.show_movies()
@@ -60,13 +116,58 @@ class MainApp(QMainWindow, Ui_MainWindow):
         # Connect UI events
         self._connect_ui_events()
         self.setup_account_menu()
-    
+
+    def start_catalogue_load(self):
+        """
+        Load the startup data (users + catalogue CSV) on a worker thread.
+
+        Called after the window is shown so first paint doesn't wait on
+        the file reads; views refresh once the data lands.
+        """
+        self._catalogue_loaded.connect(self._on_catalogue_loaded)
+        self._catalogue_loader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="catalogue-load"
+        )
+        future = self._catalogue_loader.submit(self._load_startup_data)
+        future.add_done_callback(self._on_catalogue_load_done)
+
+    def _load_startup_data(self):
+        """Read the user database and the catalogue CSV (worker thread)."""
+        self.user_manager.load_users()
+        self.catalogue.load_from_csv()
+
+    def _on_catalogue_load_done(self, future):
+        """
+        Hand the finished load back to the GUI thread (worker callback).
+
+        Args:
+            future: Completed future wrapping load_from_csv
+        """
+        error = future.exception()
+        if error is not None:
+            logger.error("Failed to load the catalogue: %s", error)
+        self._catalogue_loaded.emit()
+
+    @pyqtSlot()
+    def _on_catalogue_loaded(self):
+        """Rebuild the indexes and views now that the catalogue is loaded."""
+        self.controller = MovieController(self.catalogue)
+        self._current_view_key = None
+        self.show_movies()
+        # Reflect the restored login state (current_user comes from disk)
+        self.setup_account_menu()
+
+
     def _connect_ui_events(self):
         """Connect all UI event handlers."""
         self.searchButton.clicked.connect(self.on_search_clicked)
         self.searchBar.returnPressed.connect(self.on_search_clicked)
         self.acceuilButton.clicked.connect(self.on_home_clicked)
         self.recomandationButton.clicked.connect(self.on_recommendation_clicked)
+        # Genre rows below the fold stay as placeholders until scrolled to
+        self.scrollArea.verticalScrollBar().valueChanged.connect(
+            self._on_vertical_scroll
+        )
     
     # ========== UI SETUP METHODS ==========
     
@@ -74,47 +175,68 @@ class MainApp(QMainWindow, Ui_MainWindow):
         """
         Configure the dropdown menu for the Account button.
         Displays Login or Logout depending on the connection status.
+
+        The menu and its actions are built once; login/logout only
+        toggles which actions are visible instead of rebuilding the menu.
         """
+        if getattr(self, '_account_menu', None) is None:
+            self._build_account_menu()
+
+        user = self.user_manager.current_user
+
+        if user:
+            self._profile_action.setText(f"{user.username}")
+        for action in self._logged_in_actions:
+            action.setVisible(user is not None)
+        self._login_action.setVisible(user is None)
+
+    def _build_account_menu(self):
+        """Create the account menu and all its actions (both states)."""
         account_menu = QMenu(self)
         account_menu.setObjectName("accountMenu")
-        
-        if self.user_manager.current_user:
-            user = self.user_manager.current_user
-            
-            # Username (disabled)
-            profile_action = QAction(f"{user.username}", self)
-            profile_action.setEnabled(False)
-            account_menu.addAction(profile_action)
-            
-            account_menu.addSeparator()
-            
-            # Favorites
-            favorites_action = QAction("My likes", self)
-            favorites_action.triggered.connect(self.on_favorites_clicked)
-            account_menu.addAction(favorites_action)
-            
-            # Watchlist
-            watchlist_action = QAction("My watch list", self)
-            watchlist_action.triggered.connect(self.on_watchlist_clicked)
-            account_menu.addAction(watchlist_action)
-            
-            # Genre preferences
-            genre_action = QAction("My genre preferences", self)
-            genre_action.triggered.connect(self.on_genre_preferences_clicked)
-            account_menu.addAction(genre_action)
-            
-            account_menu.addSeparator()
-            
-            # Logout
-            logout_action = QAction("Logout", self)
-            logout_action.triggered.connect(self.on_logout_clicked)
-            account_menu.addAction(logout_action)
-        else:
-            # Login
-            login_action = QAction("Login", self)
-            login_action.triggered.connect(self.on_login_clicked)
-            account_menu.addAction(login_action)
-        
+
+        # Username (disabled)
+        profile_action = QAction("", self)
+        profile_action.setEnabled(False)
+        account_menu.addAction(profile_action)
+
+        top_separator = account_menu.addSeparator()
+
+        # Favorites
+        favorites_action = QAction("My likes", self)
+        favorites_action.triggered.connect(self.on_favorites_clicked)
+        account_menu.addAction(favorites_action)
+
+        # Watchlist
+        watchlist_action = QAction("My watch list", self)
+        watchlist_action.triggered.connect(self.on_watchlist_clicked)
+        account_menu.addAction(watchlist_action)
+
+        # Genre preferences
+        genre_action = QAction("My genre preferences", self)
+        genre_action.triggered.connect(self.on_genre_preferences_clicked)
+        account_menu.addAction(genre_action)
+
+        bottom_separator = account_menu.addSeparator()
+
+        # Logout
+        logout_action = QAction("Logout", self)
+        logout_action.triggered.connect(self.on_logout_clicked)
+        account_menu.addAction(logout_action)
+
+        # Login
+        login_action = QAction("Login", self)
+        login_action.triggered.connect(self.on_login_clicked)
+        account_menu.addAction(login_action)
+
+        self._account_menu = account_menu
+        self._profile_action = profile_action
+        self._login_action = login_action
+        self._logged_in_actions = (
+            profile_action, top_separator, favorites_action, watchlist_action,
+            genre_action, bottom_separator, logout_action
+        )
+
         self.accountButton.setMenu(account_menu)
     
     # ========== DISPLAY METHODS ==========
@@ -129,10 +251,23 @@ class MainApp(QMainWindow, Ui_MainWindow):
         """
         if movie_list is None:
             movie_list = self.controller.get_all_movies()
-        
-        
+
+        self._current_movie_list = movie_list
+
+        # Reloads often resolve to the exact same view (e.g. a like toggle
+        # outside the favorites view); skip the teardown+rebuild entirely
+        # when mode, column count and movie list are all unchanged
+        view_key = (
+            self.current_view_mode,
+            self._calculate_columns(),
+            tuple(movie.system_name for movie in movie_list),
+        )
+        if view_key == self._current_view_key and self.gridLayout.count():
+            return
+        self._current_view_key = view_key
+
         self._clear_layout(self.gridLayout)
-        
+
         if self.current_view_mode == "genre":
             self._show_movie_list_by_genre(movie_list)
         elif self.current_view_mode == "grid":
@@ -146,28 +281,46 @@ class MainApp(QMainWindow, Ui_MainWindow):
         grouped_movies = self.controller.get_movies_grouped_by_genre(movie_list)
         layout = self.gridLayout
         self.displayed_cards = []
+        self._genre_rows = []
         max_col = self._calculate_columns()
         
         for col in range(10):  # Reset up to 10 columns (more than max)
             layout.setColumnStretch(col, 0)
-        
-        row = 0
-        for genre, movies in grouped_movies.items():
-            if movies:
+
+        # One relayout/repaint for the whole batch instead of one per row
+        self.scrollAreaWidgetContents.setUpdatesEnabled(False)
+        try:
+            # Grouping never produces empty buckets (genres only appear in
+            # the index/defaultdict when a movie is appended), so every
+            # entry gets a row
+            row = 0
+            for genre, movies in grouped_movies.items():
                 genre_row = GenreRow(genre, movies, self.user_manager)
                 layout.addWidget(genre_row, row, 0, 1, max_col)
-                
+
+                # Cards are created lazily as the row scrolls; wire each
+                # one up as it appears
+                genre_row.card_created.connect(self._on_genre_card_created)
                 for card_widget in genre_row.get_cards():
-                    self._connect_card_signals(card_widget)
-                    self.displayed_cards.append(card_widget)
-                
+                    self._on_genre_card_created(card_widget)
+
+                self._genre_rows.append(genre_row)
                 row += 1
-        
+        finally:
+            self.scrollAreaWidgetContents.setUpdatesEnabled(True)
+
+        # Warm the caches for each row's leading posters so scrolling a
+        # row into view doesn't wait on full-size decodes
+        for movies in grouped_movies.values():
+            prefetch_posters(movies, limit=max_col)
+
         try:
+            # One explicit, authoritative layout pass for the batch
+            layout.activate()
             self.scrollAreaWidgetContents.adjustSize()
         except Exception:
             pass
-    
+
     def _show_movie_list_by_grid(self, movie_list):
         """
         Update the display of movie cards with improved centering for short lists.
@@ -186,40 +339,48 @@ class MainApp(QMainWindow, Ui_MainWindow):
         
         if num_movies == 0:
             return  # Nothing to display
-        
-        if num_movies < max_col:
-            # Center a single row
-            start_col = (max_col - num_movies) // 2
-            row = 0
-            col = start_col
-            
-            for film in movie_list:
-                card_widget = createFilmCard(film, self.user_manager)
-                self._connect_card_signals(card_widget)
-                self.displayed_cards.append(card_widget)
-                layout.addWidget(card_widget, row, col)
-                col += 1
-        else:
-            # Normal grid layout
-            row, col = 0, 0
-            
-            for film in movie_list:
-                card_widget = createFilmCard(film, self.user_manager)
-                self._connect_card_signals(card_widget)
-                self.displayed_cards.append(card_widget)
-                layout.addWidget(card_widget, row, col)
-                col += 1
-                if col >= max_col:
-                    col = 0
-                    row += 1
-        
+
+        # One relayout/repaint for the whole batch instead of one per card
+        self.scrollAreaWidgetContents.setUpdatesEnabled(False)
+        try:
+            if num_movies < max_col:
+                # Center a single row (card button connections batched)
+                start_col = (max_col - num_movies) // 2
+                row = 0
+                col = start_col
+
+                with ConnectionQueue():
+                    for film in movie_list:
+                        card_widget = self._get_pooled_card(film)
+                        self.displayed_cards.append(card_widget)
+                        layout.addWidget(card_widget, row, col)
+                        col += 1
+            else:
+                # Normal grid layout (card button connections batched)
+                row, col = 0, 0
+
+                with ConnectionQueue():
+                    for film in movie_list:
+                        card_widget = self._get_pooled_card(film)
+                        self.displayed_cards.append(card_widget)
+                        layout.addWidget(card_widget, row, col)
+                        col += 1
+                        if col >= max_col:
+                            col = 0
+                            row += 1
+        finally:
+            self.scrollAreaWidgetContents.setUpdatesEnabled(True)
+
         # Don't use setColumnStretch - let natural layout handle spacing
-        
+
         try:
+            # One explicit, authoritative layout pass for the batch
+            layout.activate()
             self.scrollAreaWidgetContents.adjustSize()
         except Exception:
             pass
     
+    @pyqtSlot(object)
     def show_movie_detail_modal(self, movie):
         """
         Display the movie detail window.
@@ -245,37 +406,129 @@ class MainApp(QMainWindow, Ui_MainWindow):
         min_columns = 2
         max_columns = 7   # More columns possible with narrower cards
         default_columns = 4
-        
+
         available_width = self.scrollArea.width() - 40
-        
+
+        # Same width, same answer; called repeatedly per rebuild and per
+        # resize tick, so skip the recomputation when nothing moved
+        cached_width, cached_columns = self._columns_for_width
+        if available_width == cached_width:
+            return cached_columns
+
         if available_width < 500:
-            return default_columns
-        
-        columns = max(min_columns, min(max_columns, available_width // card_width))
+            columns = default_columns
+        else:
+            columns = max(min_columns, min(max_columns, available_width // card_width))
+
+        self._columns_for_width = (available_width, columns)
         return columns
     
     def _clear_layout(self, layout):
         """
         Private helper to properly clear a layout.
-        
+
+        Repaints are suspended for the whole teardown and discarded
+        widgets are moved to a single off-screen trash widget deleted in
+        one go, so clearing N widgets costs one relayout instead of N.
+        Pooled FilmCards are only detached (they get reparented on the
+        next grid display); other widgets such as genre rows are deleted.
+
         Args:
             layout: QLayout to clear
         """
         self.displayed_cards.clear()
-        
-        while layout.count():
-            item = layout.takeAt(0)
-            if item is None:
-                continue
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater()
-            else:
-                sub_layout = item.layout()
-                if sub_layout:
-                    self._clear_layout(sub_layout)
-    
+        self._genre_rows = []
+
+        owner = layout.parentWidget()
+        if owner is not None:
+            owner.setUpdatesEnabled(False)
+        try:
+            trash = QWidget()
+            self._drain_layout(layout, trash)
+            trash.deleteLater()
+        finally:
+            if owner is not None:
+                owner.setUpdatesEnabled(True)
+
+    def _drain_layout(self, layout, trash):
+        """
+        Detach every widget from a layout, walking sub-layouts iteratively.
+
+        Args:
+            layout: QLayout to drain
+            trash: Hidden widget collecting the widgets to delete
+        """
+        stack = [layout]
+        while stack:
+            current = stack.pop()
+            # Take from the back: takeAt(0) shifts Qt's item vector on
+            # every call, turning a clear into O(n^2)
+            while current.count():
+                item = current.takeAt(current.count() - 1)
+                if item is None:
+                    continue
+                widget = item.widget()
+                if widget:
+                    if isinstance(widget, FilmCard):
+                        widget.setParent(None)
+                    else:
+                        widget.setParent(trash)
+                else:
+                    sub_layout = item.layout()
+                    if sub_layout:
+                        stack.append(sub_layout)
+
+    def _get_pooled_card(self, film):
+        """
+        Get the card for a movie from the pool, creating it on first use.
+
+        Grid views are rebuilt on every search, resize and view switch;
+        reusing one card per movie turns those rebuilds into cheap
+        reparenting instead of widget construction.
+
+        Args:
+            film: Movie instance to display
+
+        Returns:
+            FilmCard: The pooled card for this movie
+        """
+        card_widget = self._card_pool.get(film.system_name)
+        if card_widget is None:
+            card_widget = createFilmCard(film, self.user_manager)
+            self._connect_card_signals(card_widget)
+            self._card_pool[film.system_name] = card_widget
+        return card_widget
+
+    def _invalidate_card_pool(self):
+        """Drop all pooled cards (their like state is user-specific)."""
+        for card_widget in self._card_pool.values():
+            card_widget.setParent(None)
+            card_widget.deleteLater()
+        self._card_pool.clear()
+        self._current_view_key = None
+    
+    @pyqtSlot(int)
+    def _on_vertical_scroll(self, value):
+        """
+        Materialize cards in genre rows that scrolled into view.
+
+        Args:
+            value: New vertical scrollbar position (unused)
+        """
+        for genre_row in self._genre_rows:
+            genre_row._materialize_visible_cards()
+
+    @pyqtSlot(object)
+    def _on_genre_card_created(self, card):
+        """
+        Wire a lazily created genre-row card into the view.
+
+        Args:
+            card: FilmCard instance announced by a GenreRow
+        """
+        self._connect_card_signals(card)
+        self.displayed_cards.append(card)
+
     def _connect_card_signals(self, card):
         """
         Connect the signals of a movie card for synchronization.
@@ -288,33 +541,43 @@ class MainApp(QMainWindow, Ui_MainWindow):
     
     # ========== SYNCHRONIZATION METHODS ==========
     
+    @pyqtSlot(str, bool)
     def _sync_all_cards_like_state(self, film_id, is_liked):
         """
         Synchronize the like state of all displayed cards for a given movie.
-        
+
+        Updates are coalesced: a burst of like toggles in one event-loop
+        turn is drained by a single zero-delay flush, which also schedules
+        at most one view reload instead of one per emission.
+
         Args:
             film_id: Movie identifier
             is_liked: New like state
         """
-        # Filter out deleted cards
-        valid_cards = []
-        for card in self.displayed_cards:
-            try:
-                if card.parent() is not None and hasattr(card, 'sync_like_state'):
-                    card.sync_like_state(film_id, is_liked)
-                    valid_cards.append(card)
-            except RuntimeError:
-                pass
-        
-        self.displayed_cards = valid_cards
-        
+        self._pending_like_updates[film_id] = is_liked
+        if not self._like_flush_scheduled:
+            self._like_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_like_updates)
+
+    @pyqtSlot()
+    def _flush_like_updates(self):
+        """Apply all pending like updates in one pass."""
+        self._like_flush_scheduled = False
+        pending, self._pending_like_updates = self._pending_like_updates, {}
+
+        # Only the cards registered for each movie are touched, instead of
+        # scanning every displayed card
+        for film_id in pending:
+            refresh_cards_for_movie(film_id)
+
         # Reload views if necessary
         if self.current_view == "favorites":
             QTimer.singleShot(200, self._reload_favorites_view)
         elif self.current_view == "recommendation":
             QTimer.singleShot(200, self._reload_recomandation_vue)
-        
-    
+
+
+    @pyqtSlot(str, bool)
     def _on_watchlist_changed(self, movie_id, is_in_watchlist):
         """
         Handle watchlist change from movie detail modal.
@@ -323,25 +586,26 @@ class MainApp(QMainWindow, Ui_MainWindow):
             movie_id: Movie identifier
             is_in_watchlist: New watchlist state
         """
-        print(f"Watchlist changed for {movie_id}: {is_in_watchlist}")
+        logger.debug("Watchlist changed for %s: %s", movie_id, is_in_watchlist)
         
         # Update modal button if still open
-        if hasattr(self, 'detail_window') and self.detail_window.isVisible():
+        if self.detail_window is not None and self.detail_window.isVisible():
             self.detail_window.update_watchlist_button()
         
         # Reload watchlist view if active
         if self.current_view == "watchlist":
-            print("Reloading watchlist view...")
+            logger.debug("Reloading watchlist view...")
             user = self.user_manager.current_user
             if user:
                 watchlist = self.controller.get_wathclist_movie(user)
-                
+
                 if not watchlist:
-                    print("Watchlist is now empty")
+                    logger.debug("Watchlist is now empty")
                     self._clear_layout(self.gridLayout)
                 else:
                     self.show_movies(watchlist)
     
+    @pyqtSlot(str, bool)
     def _on_watched_changed(self, movie_id, is_watched):
         """
         Handle watched status change from movie detail modal.
@@ -350,7 +614,7 @@ class MainApp(QMainWindow, Ui_MainWindow):
             movie_id: Movie identifier
             is_watched: New watched state
         """
-        print(f"Watched status changed for {movie_id}: {is_watched}")
+        logger.debug("Watched status changed for %s: %s", movie_id, is_watched)
         
         # Auto-remove from watchlist when marked as watched
         if is_watched:
@@ -358,18 +622,18 @@ class MainApp(QMainWindow, Ui_MainWindow):
             if user and user.is_in_watchlist(movie_id):
                 user.remove_from_watchlist(movie_id)
                 self.user_manager.save_users()
-                print(f"Removed {movie_id} from watchlist (marked as watched)")
+                logger.debug("Removed %s from watchlist (marked as watched)", movie_id)
                 
-                if hasattr(self, 'detail_window') and self.detail_window.isVisible():
+                if self.detail_window is not None and self.detail_window.isVisible():
                     self.detail_window.update_watchlist_button()
         
         # Update modal buttons
-        if hasattr(self, 'detail_window') and self.detail_window.isVisible():
+        if self.detail_window is not None and self.detail_window.isVisible():
             self.detail_window.update_watched_button()
         
         # Reload watchlist view if active
         if self.current_view == "watchlist" and is_watched:
-            print("Reloading watchlist view (movie marked as watched)...")
+            logger.debug("Reloading watchlist view (movie marked as watched)...")
             user = self.user_manager.current_user
             if user:
                 watchlist = self.controller.get_wathclist_movie(user)
@@ -381,7 +645,7 @@ class MainApp(QMainWindow, Ui_MainWindow):
         
         # Reload recommendations if active
         if self.current_view == "recommendation":
-            print("Reloading recommendations (watched status changed)...")
+            logger.debug("Reloading recommendations (watched status changed)...")
             user = self.user_manager.current_user
             if user:
                 recommendations = self.controller.get_recommended_movies(user)
@@ -389,38 +653,41 @@ class MainApp(QMainWindow, Ui_MainWindow):
     
     # ========== RELOAD METHODS ==========
     
+    @pyqtSlot()
     def _reload_favorites_view(self):
         """Fully reload the favorites view (called with delay)."""
         user = self.user_manager.current_user
         if not user or self.current_view != "favorites":
             return
         
-        print(f"Reloading favorites view for {user.username}")
+        logger.debug("Reloading favorites view for %s", user.username)
         favorites = self.controller.get_favorite_movies(user)
-        
+
         if not favorites:
-            print("No favorites to display")
+            logger.debug("No favorites to display")
             self._clear_layout(self.gridLayout)
         else:
             self.show_movies(favorites)
     
+    @pyqtSlot()
     def _reload_recomandation_vue(self):
         """Fully reload the recommendation view (called with delay)."""
         user = self.user_manager.current_user
         if not user or self.current_view != "recommendation":
             return
         
-        print(f"Reloading recommendation view for {user.username}")
+        logger.debug("Reloading recommendation view for %s", user.username)
         recommendations = self.controller.get_recommended_movies(user)
-        
+
         if not recommendations:
-            print("No recommendations to display")
+            logger.debug("No recommendations to display")
             self._clear_layout(self.gridLayout)
         else:
             self.show_movies(recommendations)
     
     # ========== EVENT HANDLERS - Navigation ==========
     
+    @pyqtSlot()
     def on_home_clicked(self):
         """Handler for the Home button click."""
         self.searchBar.clear()
@@ -430,10 +697,11 @@ class MainApp(QMainWindow, Ui_MainWindow):
         self.current_view_mode = "genre"
         self.show_movies(all_movies)
     
+    @pyqtSlot()
     def on_recommendation_clicked(self):
         """Handler for the Recommendation button click."""
         if not self.user_manager.current_user:
-            print("Please log in to see recommendations")
+            logger.warning("Please log in to see recommendations")
             return
         
         user = self.user_manager.current_user
@@ -445,6 +713,7 @@ class MainApp(QMainWindow, Ui_MainWindow):
         self.current_view_mode = "genre"
         self.show_movies(recommendations)
     
+    @pyqtSlot()
     def on_search_clicked(self):
         """Handler for the Search button click."""
         query = self.searchBar.text().strip()
@@ -458,42 +727,54 @@ class MainApp(QMainWindow, Ui_MainWindow):
     
     # ========== EVENT HANDLERS - Account Menu ==========
     
+    @pyqtSlot()
     def on_login_clicked(self):
         """Handler for login."""
         user = show_login_dialog(self.user_manager, self)
         
         if user:
-            print(f"Logged in as {user.username}")
+            logger.info("Logged in as %s", user.username)
+            self._invalidate_card_pool()
             self.setup_account_menu()
+            # Re-render the current view with fresh cards so the grid
+            # isn't left showing the widgets the pool just destroyed
+            self.show_movies(self._current_movie_list)
     
+    @pyqtSlot()
     def on_logout_clicked(self):
         """Handler for logout."""
         if self.user_manager.current_user:
             if confirm_logout(self.user_manager.current_user.username, self):
-                print(f"Logging out {self.user_manager.current_user.username}")
+                logger.info("Logging out %s", self.user_manager.current_user.username)
                 self.user_manager.current_user = None
                 self.user_manager.save_users()
+                self._invalidate_card_pool()
                 self.setup_account_menu()
+                # The per-user views (favorites, watchlist, ...) no longer
+                # apply and their cards were just destroyed; go back home
+                self.on_home_clicked()
         else:
-            print("No user logged in")
+            logger.warning("No user logged in")
     
+    @pyqtSlot()
     def on_genre_preferences_clicked(self):
         """Handler to display the genre preferences dialog."""
         if not self.user_manager.current_user:
-            print("Please log in to manage your preferences")
+            logger.warning("Please log in to manage your preferences")
             return
         
         all_genres = self.catalogue.get_all_genres()
         show_genre_preferences_dialog(self.user_manager, all_genres, self)
     
+    @pyqtSlot()
     def on_favorites_clicked(self):
         """Handler to display favorites."""
         user = self.user_manager.current_user
         if not user:
-            print("Please log in to see your favorites")
+            logger.warning("Please log in to see your favorites")
             return
-        
-        print(f"Favorites of {user.username}: {user.favorites}")
+
+        logger.debug("Favorites of %s: %s", user.username, user.favorites)
         self.searchBar.clear()
         
         favorites = self.controller.get_favorite_movies(user)
@@ -502,14 +783,15 @@ class MainApp(QMainWindow, Ui_MainWindow):
         self.current_view_mode = "grid"
         self.show_movies(favorites)
     
+    @pyqtSlot()
     def on_watchlist_clicked(self):
         """Handler to display the watchlist."""
         user = self.user_manager.current_user
         if not user:
-            print("Warning: Please log in to see your list")
+            logger.warning("Please log in to see your list")
             return
-        
-        print(f"Watch list of {user.username}: {user.watchlist}")
+
+        logger.debug("Watch list of %s: %s", user.username, user.watchlist)
         watchlist = self.controller.get_wathclist_movie(user)
         
         self.current_view = "watchlist"
@@ -521,71 +803,65 @@ class MainApp(QMainWindow, Ui_MainWindow):
     def resizeEvent(self, event):
         """Event handler for window resize."""
         super().resizeEvent(event)
-        
+
         # Prevent resize loops during initial setup
-        if not hasattr(self, "controller"):
+        if self.controller is None:
             return
-        
+
         # Only recalculate columns if in grid mode (genre rows handle their own sizing)
         if self.current_view_mode != "grid":
             return
-        
+
         # Check if layout is empty
         if self.gridLayout.count() == 0:
             return
-        
-        # Calculate new column count
+
+        # Rebuilding the grid per resize tick recreates every card for
+        # each pixel of drag; restart the timer instead so the rebuild
+        # only fires once the user stops resizing
+        self._resize_timer.start(150)
+
+    @pyqtSlot()
+    def _do_resize_rebuild(self):
+        """Rebuild the grid after a resize settles, if columns changed."""
         new_columns = self._calculate_columns()
-        
+
         # Only redraw if column count actually changed
-        if not hasattr(self, '_last_column_count') or self._last_column_count != new_columns:
+        if self._last_column_count != new_columns:
             self._last_column_count = new_columns
-            print(f"DEBUG resizeEvent: Redrawing with {new_columns} columns")
-            
-            # Determine movie list based on current view state
-            movie_list = []
-            
-            if self.current_view == "search":
-                try:
-                    query = self.searchBar.text().strip()
-                    movie_list = self.controller.search_movies(query)
-                except Exception:
-                    movie_list = []
-            elif self.current_view == "favorites":
-                user = getattr(self.user_manager, "current_user", None)
-                movie_list = self.controller.get_favorite_movies(user) if user else []
-            elif self.current_view == "recommendation":
-                user = getattr(self.user_manager, "current_user", None)
-                movie_list = self.controller.get_recommended_movies(user) if user else []
-            elif self.current_view == "watchlist":
-                user = getattr(self.user_manager, "current_user", None)
-                movie_list = self.controller.get_wathclist_movie(user) if user else []
-            else:  # home view
+            logger.debug("resizeEvent: Redrawing with %d columns", new_columns)
+
+            # A resize doesn't change what is displayed, only its layout;
+            # reuse the list show_movies last rendered
+            movie_list = self._current_movie_list
+            if movie_list is None:
                 movie_list = self.controller.get_all_movies()
-            
+
             try:
                 self.show_movies(movie_list)
             except Exception as e:
-                print(f"Error during resize event handling: {e}")
+                logger.error("Error during resize event handling: %s", e)
 
 # ========== APPLICATION ENTRY POINT ==========
 
 if __name__ == "__main__":
     catalog = Catalog("./csv_data/catalog.csv")
-    catalog.load_from_csv()
-    
+
     app = QApplication(sys.argv)
-    
+
     # Load the Netflux stylesheet
     style_path = "./assets/styles.qss"
     if os.path.exists(style_path):
-        with open(style_path, "r", encoding="utf-8") as f: 
+        with open(style_path, "r", encoding="utf-8") as f:
             app.setStyleSheet(f.read())
         print("Netflux stylesheet loaded")
     else:
         print(f"Error: Stylesheet not found: {style_path}")
         raise FileNotFoundError(f"The style file '{style_path}' is missing. Please make sure it exists.")
-    
+
+    # Show the (empty) window immediately; the CSV parses in the
+    # background and the views fill in once it's loaded
     window = MainApp(catalog)
     window.show()
+    window.start_catalogue_load()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,6 +1,8 @@
 """
 Catalog model for managing the movie collection.
 """
+import csv
+
 from .movie import Movie
 
 class Catalog:
@@ -15,13 +17,70 @@ class Catalog:
     def __init__(self, path):
         """
         Initialize the catalog.
-        
+
         Args:
             path (str): Path to the movies CSV file
         """
         self.path = path
         self.movies = []
-    
+        # Lowercased search columns, kept in sync with self.movies so
+        # searches don't re-lower every title/director on every call
+        self._titles_lower = []
+        self._directors_lower = []
+        # system_name -> Movie index for O(1) id lookups
+        self._by_system_name = {}
+        # genre -> [Movie] adjacency, shared by grouping and filtering
+        self._genre_to_movies = {}
+        self._genre_index_count = -1
+        self._sorted_genres = None
+        # title trigram -> set of movie indices, for fast keyword search
+        self._title_trigrams = {}
+        self._trigram_index_count = -1
+
+    def _ensure_title_trigrams(self):
+        """Rebuild the title trigram index if the movie list changed."""
+        if self._trigram_index_count != len(self.movies):
+            trigrams = {}
+            for i, movie in enumerate(self.movies):
+                title = movie.title.lower()
+                for j in range(len(title) - 2):
+                    trigrams.setdefault(title[j:j + 3], set()).add(i)
+            self._title_trigrams = trigrams
+            self._trigram_index_count = len(self.movies)
+
+    def _ensure_genre_index(self):
+        """Rebuild the genre adjacency index if the movie list changed."""
+        if self._genre_index_count != len(self.movies):
+            index = {}
+            for movie in self.movies:
+                for genre in movie.genres:
+                    index.setdefault(genre, []).append(movie)
+            self._genre_to_movies = index
+            self._genre_index_count = len(self.movies)
+            self._sorted_genres = None  # Derived cache, rebuilt on demand
+
+    def get_genre_index(self):
+        """
+        Get the genre -> movies adjacency index.
+
+        Built in a single pass over the catalog and reused by grouping,
+        filtering and recommendations instead of re-walking every movie's
+        genre list per call. Callers must not mutate the returned lists.
+
+        Returns:
+            dict[str, list[Movie]]: Movies per genre, in catalog order
+        """
+        self._ensure_genre_index()
+        return self._genre_to_movies
+
+    def _ensure_search_columns(self):
+        """Rebuild the lowercased title/director columns if movies changed."""
+        if len(self._titles_lower) != len(self.movies):
+            self._titles_lower = [m.title.lower() for m in self.movies]
+            self._directors_lower = [
+                m.director.lower() if m.director else "" for m in self.movies
+            ]
+
     def load_from_csv(self):
         """
         Load movies from the CSV file.
@@ -35,22 +94,27 @@ class Catalog:
         """
         try:
             with open(self.path, "r", encoding="utf-8-sig") as f:
-                lines = f.readlines()
-                
-                # Skip the header line
-                if lines and lines[0].strip().startswith("title:"):
-                    lines = lines[1:]
-                
-                for line in lines:
-                    line = line.strip()
-                    if not line:
+                # csv.reader splits in C and streams rows, instead of
+                # reading every line into memory and splitting in Python.
+                # QUOTE_NONE keeps the old plain-split(':') semantics.
+                reader = csv.reader(f, delimiter=":", quoting=csv.QUOTE_NONE)
+
+                for line_number, row in enumerate(reader):
+                    if not row:
                         continue  # Skip empty lines
 
-                    parts = [p.strip() for p in line.split(":")]
+                    parts = [p.strip() for p in row]
+
+                    # Skip the header line
+                    if line_number == 0 and parts[0] == "title":
+                        continue
+
+                    if not any(parts):
+                        continue  # Skip whitespace-only lines
 
                     # Expected: title:year:minutes:genres:system_name:director:cast:synopsis
                     if len(parts) < 5:
-                        print(f"Warning: Line skipped (invalid format): {line}")
+                        print(f"Warning: Line skipped (invalid format): {':'.join(row)}")
                         continue
 
                     title = parts[0]
@@ -93,11 +157,19 @@ class Catalog:
         """
         if not genres_list:
             return []
-            
+
+        genre_index = self.get_genre_index()
+
+        # Walk only the requested genres' buckets; the id-based seen set
+        # deduplicates movies belonging to several of them
+        seen = set()
         results = []
-        for movie in self.movies:
-            if any(genre in movie.genres for genre in genres_list):
-                results.append(movie)
+        for genre in genres_list:
+            for movie in genre_index.get(genre, ()):
+                movie_id = id(movie)
+                if movie_id not in seen:
+                    seen.add(movie_id)
+                    results.append(movie)
         return results
     
     def get_movies_by_title(self, keywords):
@@ -112,16 +184,35 @@ class Catalog:
         """
         if not keywords:
             return []
-            
+
         words = keywords.lower().split()
-        results = []
+        self._ensure_search_columns()
+        self._ensure_title_trigrams()
 
-        for movie in self.movies:
-            title_lower = movie.title.lower()
-            if any(word in title_lower for word in words):
-                results.append(movie)
+        matched = set()
+        for word in words:
+            if len(word) < 3:
+                # Too short for the trigram index; scan the title column
+                matched.update(
+                    i for i, title in enumerate(self._titles_lower) if word in title
+                )
+                continue
 
-        return results
+            # Intersect the posting sets of the keyword's trigrams, then
+            # verify the substring only on that small candidate set
+            postings = [
+                self._title_trigrams.get(word[j:j + 3])
+                for j in range(len(word) - 2)
+            ]
+            if any(posting is None for posting in postings):
+                continue  # Some trigram never occurs: no title can match
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            matched.update(
+                i for i in candidates if word in self._titles_lower[i]
+            )
+
+        return [self.movies[i] for i in sorted(matched)]
     
     def get_movie_by_system_name(self, system_name):
         """
@@ -133,23 +224,24 @@ class Catalog:
         Returns:
             Movie|None: The found movie or None
         """
-        for movie in self.movies:
-            if movie.system_name == system_name:
-                return movie
-        return None
+        if len(self._by_system_name) != len(self.movies):
+            self._by_system_name = {m.system_name: m for m in self.movies}
+        return self._by_system_name.get(system_name)
     
     def get_all_genres(self):
         """
         Get all unique genres from the catalog.
-        
+
+        The sorted tuple is derived from the genre index and cached, so
+        repeated calls don't re-scan and re-sort per invocation.
+
         Returns:
-            list[str]: Sorted list of genres
+            tuple[str]: Sorted tuple of genres
         """
-        genres = set()
-        for movie in self.movies:
-            for genre in movie.genres:
-                genres.add(genre)
-        return sorted(genres)
+        self._ensure_genre_index()
+        if self._sorted_genres is None:
+            self._sorted_genres = tuple(sorted(self._genre_to_movies))
+        return self._sorted_genres
     
     def get_all_catalog(self):
         """
@@ -181,19 +273,15 @@ class Catalog:
         """
         if not keywords:
             return []
-            
-        words = keywords.lower().split()
-        results = []
 
-        for movie in self.movies:
-            title_lower = movie.title.lower()
-            director_lower = movie.director.lower() if movie.director else ""
-            
-            # Check if any keyword matches in title or director
-            if any(word in title_lower or word in director_lower for word in words):
-                results.append(movie)
+        words = keywords.lower().split()
+        self._ensure_search_columns()
 
-        return results
+        return [
+            movie for movie, title_lower, director_lower in zip(
+                self.movies, self._titles_lower, self._directors_lower)
+            if any(word in title_lower or word in director_lower for word in words)
+        ]
     
     def __len__(self):
         """Allow using len(catalog)."""
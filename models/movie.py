@@ -19,7 +19,13 @@ class Movie:
         tile_path (str): Path to the thumbnail image
         video_path (str): Path to the video file (trailer)
     """
-    
+
+    # Movies are allocated by the thousands and read in tight loops;
+    # __slots__ drops the per-instance __dict__ and speeds attribute access
+    __slots__ = ('title', 'year', 'minutes', 'genres', 'system_name',
+                 'director', 'cast', 'synopsis', 'tile_path', 'video_path',
+                 '_display_meta')
+
     def __init__(self, title, year, minutes, genres, system_name, director="", cast="", synopsis=""):
         """
         Initialize a movie.
@@ -43,8 +49,27 @@ class Movie:
         self.cast = cast
         self.synopsis = synopsis
         self.tile_path = f"./data/movies_tiles/{system_name}.jpg"
-        self.video_path = f"./data/movies/{system_name}.mp4"     
-    
+        self.video_path = f"./data/movies/{system_name}.mp4"
+        self._display_meta = None  # Cached display string, built on first access
+
+    @property
+    def display_meta(self):
+        """
+        Short display string for cards, e.g. "Action, Drama... • 120m".
+
+        Built once on first access and cached, so the card grid doesn't
+        re-join genre lists for every card on every rebuild.
+
+        Returns:
+            str: Genres (first two) and duration, ready for display
+        """
+        if self._display_meta is None:
+            genre_text = ', '.join(self.genres[:2])
+            if len(self.genres) > 2:
+                genre_text += '...'
+            self._display_meta = f"{genre_text} • {self.minutes}m"
+        return self._display_meta
+
     def __repr__(self):
         """Text representation of the movie."""
         return f"<Movie title='{self.title}' ({self.year}) - {self.minutes} min>"
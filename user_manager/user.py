@@ -4,6 +4,7 @@ Saving and loading from a JSON file.
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
 
@@ -20,7 +21,10 @@ class User:
         watched (list[str]): List of watched movies
         liked_genres (list[str]): List of user's preferred genres
     """
-    
+
+    __slots__ = ('user_id', 'username', 'email', 'favorites', 'watchlist',
+                 'watched', 'liked_genres')
+
     def __init__(self, username: str, email: str = "", user_id: Optional[int] = None):
         """
         Initialize a user.
@@ -320,6 +324,12 @@ class UserManager:
         self.data_file = data_file
         self.users: Dict[int, User] = {}
         self.current_user: Optional[User] = None
+        self._dirty = False
+        self._flush_timer = None  # Created lazily once a QApplication exists
+        # Disk writes happen on this worker so a save never stalls a click
+        self._write_pool = ThreadPoolExecutor(max_workers=1,
+                                              thread_name_prefix="user-save")
+        self._last_write = None
         self._ensure_data_directory()
     
     def _ensure_data_directory(self):
@@ -360,22 +370,94 @@ class UserManager:
     
     def save_users(self) -> bool:
         """
-        Save users to the JSON file.
-        
+        Request a save of the users to the JSON file.
+
+        Writes are debounced: repeated calls within a short window (e.g.
+        a burst of like clicks) are coalesced into a single disk write
+        500 ms after the last change. Without a running Qt application
+        the save happens immediately.
+
+        Returns:
+            bool: True if the save was written or scheduled, False on error
+        """
+        self._dirty = True
+        timer = self._ensure_flush_timer()
+        if timer is None:
+            return self._write_users()
+        timer.start(500)
+        return True
+
+    def _ensure_flush_timer(self):
+        """
+        Create the debounce timer once a Qt event loop is available.
+
+        Returns:
+            QTimer|None: The single-shot flush timer, or None when
+                         running without a QApplication
+        """
+        if self._flush_timer is None:
+            try:
+                from PyQt6.QtCore import QTimer
+                from PyQt6.QtWidgets import QApplication
+            except ImportError:
+                return None
+
+            app = QApplication.instance()
+            if app is None:
+                return None
+
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self._write_users)
+            # Make sure pending changes hit the disk on exit
+            app.aboutToQuit.connect(self.flush_users)
+        return self._flush_timer
+
+    def flush_users(self) -> None:
+        """Write any pending changes to disk and wait for completion."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        if self._dirty:
+            self._write_users()
+        if self._last_write is not None:
+            self._last_write.result()
+            self._last_write = None
+
+    def _write_users(self) -> bool:
+        """
+        Hand the current user data to the background writer.
+
+        The snapshot is serialized to dicts on the calling thread so the
+        worker never reads mutable User objects; only the file write
+        leaves the UI thread.
+
+        Returns:
+            bool: True once the write has been handed off
+        """
+        self._dirty = False
+        data = {
+            "users": [user.to_dict() for user in self.users.values()],
+            "current_user_id": self.current_user.user_id if self.current_user else None
+        }
+        self._last_write = self._write_pool.submit(self._write_data, data)
+        return True
+
+    def _write_data(self, data: Dict) -> bool:
+        """
+        Write a snapshot of user data to the JSON file.
+
+        Args:
+            data: JSON-serializable snapshot of users and current user
+
         Returns:
             bool: True if saving successful, False otherwise
         """
         try:
-            data = {
-                "users": [user.to_dict() for user in self.users.values()],
-                "current_user_id": self.current_user.user_id if self.current_user else None
-            }
-            
             with open(self.data_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            
+
             return True
-            
+
         except Exception as e:
             print(f"Error: Failed to save users: {e}")
             return False
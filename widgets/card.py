@@ -3,9 +3,262 @@ Movie card widget for the Netflux application.
 Displays a movie with its image, title, genres, and interaction buttons.
 """
 from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout, QPushButton, QHBoxLayout
-from PyQt6.QtGui import QPixmap, QFontMetrics
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QFontMetrics
+from PyQt6.QtCore import QSize, Qt, pyqtSignal, pyqtSlot
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import logging
 import os
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# Poster size shared by every card (2:3 ratio)
+POSTER_WIDTH = 200
+POSTER_HEIGHT = 300
+
+# Fixed geometry shared by every card, hoisted so each card avoids
+# rebuilding QSize objects and re-resolving enum attributes
+_CARD_SIZE = QSize(200, 400)
+_POSTER_SIZE = QSize(POSTER_WIDTH, POSTER_HEIGHT)
+_LIKE_BUTTON_SIZE = QSize(32, 28)
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_LEFT_VCENTER = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+# Fallback image used when a movie has no tile on disk
+FALLBACK_TILE_PATH = "./assets/image_not_found.jpeg"
+
+# Directory holding pre-scaled poster thumbnails, generated on first run
+THUMBNAIL_CACHE_DIR = "./assets/.cache"
+
+
+def _thumbnail_cache_path(tile_path):
+    """
+    Build the on-disk cache path for a tile's pre-scaled thumbnail.
+
+    Args:
+        tile_path (str): Path to the original tile image
+
+    Returns:
+        str: Path of the cached PNG thumbnail
+    """
+    key = hashlib.blake2b(tile_path.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{THUMBNAIL_CACHE_DIR}/{key}_{POSTER_WIDTH}x{POSTER_HEIGHT}.png"
+
+
+# Shared text-layout caches: cards use the same font, so metrics and
+# elided titles are computed once instead of once per card
+_metrics_by_font = {}
+_elided_titles = {}
+
+
+def _elided_title(font, title, width):
+    """
+    Return the title elided to fit the given width, with caching.
+
+    QFontMetrics construction and elidedText() are both repeated
+    identically for every card sharing a font; both results are cached
+    keyed by the font's characteristics.
+
+    Args:
+        font (QFont): Font used by the title label
+        title (str): Full movie title
+        width (int): Available width in pixels
+
+    Returns:
+        str: Title elided with "…" if too long
+    """
+    font_key = (font.family(), font.pointSizeF(), font.weight(), font.italic())
+    cache_key = (font_key, title, width)
+
+    elided = _elided_titles.get(cache_key)
+    if elided is None:
+        metrics = _metrics_by_font.get(font_key)
+        if metrics is None:
+            metrics = _metrics_by_font[font_key] = QFontMetrics(font)
+        elided = metrics.elidedText(title, Qt.TextElideMode.ElideRight, width)
+        _elided_titles[cache_key] = elided
+    return elided
+
+
+@lru_cache(maxsize=None)
+def _tile_exists(tile_path):
+    """
+    Cached existence check for a tile image.
+
+    Tile files do not appear or disappear during a session, so the
+    stat() result is cached to avoid one syscall per card on every
+    view rebuild.
+
+    Args:
+        tile_path (str): Path to the movie tile image
+
+    Returns:
+        bool: True if the file exists
+    """
+    return os.path.exists(tile_path)
+
+# Allow enough cached pixmaps for a full catalog of posters (limit is in KB)
+QPixmapCache.setCacheLimit(65536)
+
+
+# Registry of live cards per movie id, used to broadcast like changes
+# directly to the few cards showing the same movie instead of fanning a
+# signal out to every card on screen. WeakSet drops deleted cards.
+_cards_by_movie_id = {}
+
+
+def refresh_cards_for_movie(movie_id):
+    """
+    Refresh the like button of every live card showing the given movie.
+
+    Args:
+        movie_id (str): System name of the movie whose state changed
+    """
+    for card in _cards_by_movie_id.get(movie_id, ()):
+        try:
+            card.update_like_button_state()
+        except RuntimeError:
+            pass  # Underlying C++ widget already deleted
+
+
+# Signal connections deferred while a ConnectionQueue is active
+_pending_connections = deque()
+_connection_queue_depth = 0
+
+
+class ConnectionQueue:
+    """
+    Context manager that batches signal connections during bulk card creation.
+
+    While active, FilmCard.connect_signals queues its (signal, slot) pairs
+    instead of connecting immediately; all connections are made in one pass
+    when the outermost queue exits. This keeps Qt's connection bookkeeping
+    out of the per-card construction loop.
+
+    Usage:
+        with ConnectionQueue():
+            for movie in movies:
+                cards.append(createFilmCard(movie, user_manager))
+    """
+
+    def __enter__(self):
+        global _connection_queue_depth
+        _connection_queue_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _connection_queue_depth
+        _connection_queue_depth -= 1
+        if _connection_queue_depth == 0:
+            while _pending_connections:
+                signal, slot = _pending_connections.popleft()
+                signal.connect(slot)
+        return False
+
+
+def _queue_or_connect(signal, slot):
+    """
+    Connect a signal immediately, or queue it if a ConnectionQueue is active.
+
+    Args:
+        signal: Bound Qt signal
+        slot: Callable to connect
+    """
+    if _connection_queue_depth > 0:
+        _pending_connections.append((signal, slot))
+    else:
+        signal.connect(slot)
+
+
+# Worker pool for poster decoding; QImage (unlike QPixmap) is safe to
+# create and scale outside the GUI thread
+_decode_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="poster-decode")
+
+
+def _poster_cache_key(tile_path):
+    """
+    Build the QPixmapCache key for a tile path at the card poster size.
+
+    Args:
+        tile_path (str): Path to the movie tile image
+
+    Returns:
+        str: Cache key combining path and target size
+    """
+    return f"{tile_path}@{POSTER_WIDTH}x{POSTER_HEIGHT}"
+
+
+def _decode_poster_image(tile_path):
+    """
+    Decode and scale a poster image. Runs on a worker thread.
+
+    Args:
+        tile_path (str): Path to the movie tile image
+
+    Returns:
+        QImage: Scaled poster image (converted to QPixmap on the GUI thread)
+    """
+    # Reuse the pre-scaled thumbnail from disk when available: reading a
+    # small PNG is much cheaper than decoding and resampling the full JPEG
+    cache_path = _thumbnail_cache_path(tile_path)
+    if os.path.exists(cache_path):
+        image = QImage(cache_path)
+        if not image.isNull():
+            return image
+
+    # Scale during decode: QImageReader lets the JPEG decoder produce the
+    # target size directly instead of decoding the full-resolution image
+    # into memory and resampling it afterwards
+    reader = QImageReader(tile_path)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(
+            _POSTER_SIZE, Qt.AspectRatioMode.KeepAspectRatioByExpanding
+        ))
+        image = reader.read()
+    else:
+        # Format without size support; fall back to decode-then-scale
+        image = QImage(tile_path).scaled(
+            POSTER_WIDTH, POSTER_HEIGHT,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
+    # Persist the scaled result so future runs skip the full decode
+    try:
+        os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+        image.save(cache_path, "PNG")
+    except OSError:
+        pass  # Cache directory not writable; keep serving from memory
+
+    return image
+
+
+def prefetch_posters(movies, limit=None):
+    """
+    Warm the poster caches for movies likely to be viewed soon.
+
+    Decodes run on the shared worker pool and populate the on-disk
+    thumbnail cache, so a card materializing later reads a small
+    pre-scaled PNG instead of decoding the full poster. Movies whose
+    pixmap is already cached are skipped.
+
+    Args:
+        movies (iterable): Movie objects whose posters to warm
+        limit (int, optional): Maximum number of decode jobs to submit
+    """
+    probe = QPixmap()
+    submitted = 0
+    for movie in movies:
+        if limit is not None and submitted >= limit:
+            break
+        if QPixmapCache.find(_poster_cache_key(movie.tile_path), probe):
+            continue
+        _decode_pool.submit(_decode_poster_image, movie.tile_path)
+        submitted += 1
 
 class FilmCard(QFrame):
     """
@@ -13,10 +266,17 @@ class FilmCard(QFrame):
     Cinema poster style: vertical format (2:3 ratio) like movie posters.
     """
     
+    # Avoid a per-instance __dict__: with hundreds of cards alive this
+    # saves memory and makes attribute access a fixed-offset load
+    __slots__ = ('movie', 'user_manager', '_last_liked', '_ui_built',
+                 'image_label', '_poster_key', 'like_button', 'play_button')
+
     # Signal emitted when the like status changes (movie_id, is_liked)
     like_changed = pyqtSignal(str, bool)
     # Signal emitted when the play button is clicked
     play_clicked = pyqtSignal(object)
+    # Internal signal used to marshal decoded posters back to the GUI thread
+    _poster_ready = pyqtSignal(QImage)
     
     def __init__(self, movie, user_manager=None, parent=None):
         """
@@ -30,20 +290,29 @@ class FilmCard(QFrame):
         super().__init__(parent)
         self.movie = movie
         self.user_manager = user_manager
+        self._last_liked = None  # Last rendered like state (None = never rendered)
+
+        # Register for targeted like-state broadcasts
+        _cards_by_movie_id.setdefault(movie.system_name, weakref.WeakSet()).add(self)
+
+        # UI construction is deferred until the card is first shown, so
+        # off-screen cards cost only this lightweight shell
+        self._ui_built = False
         
         # Widget configuration - Cinema poster format (2:3 ratio)
-        # Width: 200px, Height: 300px (poster) + 1000px (info) = 400 total
-        self.setMinimumSize(200, 400)
-        self.setMaximumSize(200, 400)
+        # Width: 200px, Height: 300px (poster) + 100px (info) = 400 total
+        self.setFixedSize(_CARD_SIZE)
         self.setObjectName("movieCard")
         self.setProperty("class", "movie-card")
-        
-        # Create the interface
-        self.setup_ui()
-        
-        # Connect signals
-        self.connect_signals()
-    
+
+    def showEvent(self, event):
+        """Build the card interface the first time it becomes visible."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+            self.connect_signals()
+        super().showEvent(event)
+
     def setup_ui(self):
         """Configure the card interface."""
         # Main vertical layout: image on top, info at bottom
@@ -62,37 +331,64 @@ class FilmCard(QFrame):
         image_container = QFrame()
         image_container.setObjectName("imageContainer")
         # Poster format: 200x300 (2:3 ratio)
-        image_container.setMinimumSize(200, 300)
-        image_container.setMaximumSize(200, 300)
+        image_container.setFixedSize(_POSTER_SIZE)
         
         image_layout = QVBoxLayout(image_container)
         image_layout.setContentsMargins(0, 0, 0, 0)
         image_layout.setSpacing(0)
 
-        # Load the image
-        if not os.path.exists(self.movie.tile_path):
-            pixmap = QPixmap("./assets/image_not_found.jpeg")
+        # Load the image: reuse the cached pixmap when available, otherwise
+        # decode on a worker thread and apply the result on the GUI thread
+        self.image_label = QLabel()
+        self.image_label.setAlignment(_ALIGN_CENTER)
+        self.image_label.setObjectName("movieImage")
+
+        tile_path = self.movie.tile_path
+        if not _tile_exists(tile_path):
+            tile_path = FALLBACK_TILE_PATH
+        self._poster_key = _poster_cache_key(tile_path)
+
+        pixmap = QPixmap()
+        if QPixmapCache.find(self._poster_key, pixmap):
+            self.image_label.setPixmap(pixmap)
         else:
-            pixmap = QPixmap(self.movie.tile_path)
+            self._poster_ready.connect(self._apply_poster)
+            future = _decode_pool.submit(_decode_poster_image, tile_path)
+            future.add_done_callback(self._on_poster_decoded)
+
+        image_layout.addWidget(self.image_label)
 
-        image_label = QLabel()
-        image_label.setPixmap(
-            pixmap.scaled(200, 300, 
-                         Qt.AspectRatioMode.KeepAspectRatioByExpanding, 
-                         Qt.TransformationMode.SmoothTransformation)
-        )
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setObjectName("movieImage")
-        image_layout.addWidget(image_label)
-        
         parent_layout.addWidget(image_container)
+
+    def _on_poster_decoded(self, future):
+        """
+        Forward a decoded poster to the GUI thread. Runs on a worker thread.
+
+        Args:
+            future: Completed Future holding the scaled QImage
+        """
+        try:
+            self._poster_ready.emit(future.result())
+        except RuntimeError:
+            pass  # Card was deleted before the decode finished
+
+    @pyqtSlot(QImage)
+    def _apply_poster(self, image):
+        """
+        Set the decoded poster on the card. Runs on the GUI thread.
+
+        Args:
+            image (QImage): Scaled poster image from the worker thread
+        """
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._poster_key, pixmap)
+        self.image_label.setPixmap(pixmap)
     
     def create_info_container(self, parent_layout):
         """Create the container for information and buttons."""
         info_container = QFrame()
         info_container.setObjectName("infoContainer")
-        info_container.setMinimumHeight(100)
-        info_container.setMaximumHeight(100)
+        info_container.setFixedHeight(100)
         
         main_info_layout = QVBoxLayout(info_container)
         main_info_layout.setContentsMargins(10, 8, 10, 8)
@@ -113,30 +409,20 @@ class FilmCard(QFrame):
         """Create the text section (title and metadata)."""
         # Title on single line with ellipsis if too long
         title_label = QLabel()
-        title_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        title_label.setAlignment(_ALIGN_LEFT_VCENTER)
         title_label.setObjectName("movieTitle")
         title_label.setMaximumWidth(180)
         title_label.setWordWrap(False)  # Single line only
         
-        # Use elided text for automatic ellipsis
-        font_metrics = QFontMetrics(title_label.font())
-        elided_title = font_metrics.elidedText(
-            self.movie.title, 
-            Qt.TextElideMode.ElideRight, 
-            180
-        )
-        title_label.setText(elided_title)
+        # Use elided text for automatic ellipsis (cached per font)
+        title_label.setText(_elided_title(title_label.font(), self.movie.title, 180))
         
         parent_layout.addWidget(title_label)
 
-        # Genre and duration
-        genre_text = ', '.join(self.movie.genres[:2])
-        if len(self.movie.genres) > 2:
-            genre_text += '...'
-        
-        genre_duration_label = QLabel(f"{genre_text} • {self.movie.minutes}m")
+        # Genre and duration (string cached on the movie model)
+        genre_duration_label = QLabel(self.movie.display_meta)
         genre_duration_label.setObjectName("genreDurationLabel")
-        genre_duration_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        genre_duration_label.setAlignment(_ALIGN_LEFT_VCENTER)
         genre_duration_label.setWordWrap(False)
         genre_duration_label.setMaximumWidth(180)
         parent_layout.addWidget(genre_duration_label)
@@ -152,8 +438,7 @@ class FilmCard(QFrame):
         self.like_button.setObjectName("likeButton")
         self.like_button.setProperty("movie_id", self.movie.system_name)
         self.like_button.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.like_button.setMinimumSize(32, 28)
-        self.like_button.setMaximumSize(32, 28)
+        self.like_button.setFixedSize(_LIKE_BUTTON_SIZE)
         
         # Update the like button state
         self.update_like_button_state()
@@ -173,20 +458,29 @@ class FilmCard(QFrame):
         parent_layout.addLayout(buttons_layout)
     
     def connect_signals(self):
-        """Connect button signals."""
-        self.like_button.clicked.connect(self.on_like_clicked)
-        self.play_button.clicked.connect(self.on_play_clicked)
+        """Connect button signals (deferred while a ConnectionQueue is active)."""
+        _queue_or_connect(self.like_button.clicked, self.on_like_clicked)
+        _queue_or_connect(self.play_button.clicked, self.on_play_clicked)
     
     def update_like_button_state(self):
         """Update the like button appearance based on state."""
+        if not self._ui_built:
+            return  # Button doesn't exist yet; state is applied at build time
+
         if self.user_manager and self.user_manager.current_user:
             is_liked = self.user_manager.current_user.is_favorite(self.movie.system_name)
-            self.like_button.setText("♥" if is_liked else "♡")
-            self.like_button.setProperty("liked", is_liked)
         else:
-            self.like_button.setText("♡")
-            self.like_button.setProperty("liked", False)
-        
+            is_liked = False
+
+        # Re-polishing re-evaluates the stylesheet, which is expensive;
+        # skip it entirely when the rendered state is already correct
+        if is_liked == self._last_liked:
+            return
+        self._last_liked = is_liked
+
+        self.like_button.setText("♥" if is_liked else "♡")
+        self.like_button.setProperty("liked", is_liked)
+
         # Force style refresh if available, otherwise request repaint
         style = self.like_button.style()
         if style is not None:
@@ -196,38 +490,46 @@ class FilmCard(QFrame):
             # Fallback: force a widget repaint
             self.like_button.update()
     
+    @pyqtSlot()
     def on_like_clicked(self):
         """Handler for the like button click."""
         if not self.user_manager or not self.user_manager.current_user:
-            print("Warning: Please log in to like movies")
+            logger.warning("Please log in to like movies")
             return
-        
+
         user = self.user_manager.current_user
-        
+
         # Toggle favorite status
         if user.is_favorite(self.movie.system_name):
             user.remove_favorite(self.movie.system_name)
             is_now_liked = False
-            print(f"Removed '{self.movie.title}' from {user.username}'s favorites")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Removed '%s' from %s's favorites",
+                            self.movie.title, user.username)
         else:
             user.add_favorite(self.movie.system_name)
             is_now_liked = True
-            print(f"Added '{self.movie.title}' to {user.username}'s favorites")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Added '%s' to %s's favorites",
+                            self.movie.title, user.username)
         
         # Save changes
         self.user_manager.save_users()
-        
-        # Update this card
-        self.update_like_button_state()
-        
-        # Emit signal to synchronize other cards
+
+        # Update this card and every other card showing the same movie
+        refresh_cards_for_movie(self.movie.system_name)
+
+        # Emit signal so views (favorites, recommendations) can react
         self.like_changed.emit(self.movie.system_name, is_now_liked)
      
+    @pyqtSlot()
     def on_play_clicked(self):
         """Handler for the play button click."""
-        print(f"Opening details for: {self.movie.title}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Opening details for: %s", self.movie.title)
         self.play_clicked.emit(self.movie)
     
+    @pyqtSlot(str, bool)
     def sync_like_state(self, movie_id, is_liked):
         """
         Synchronize like state with other cards.
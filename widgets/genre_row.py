@@ -2,28 +2,43 @@
 Widget for displaying a row of movies by genre with horizontal scrolling.
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame, QSizePolicy
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 import random
 
-from .card import createFilmCard
+from .card import ConnectionQueue, createFilmCard
+
+# Geometry of a card slot inside the row (must match FilmCard's fixed size)
+CARD_WIDTH = 200
+CARD_HEIGHT = 400
+CARD_SPACING = 16
+
+# Extra cards materialized on each side of the viewport so horizontal
+# scrolling never shows an empty placeholder
+PREFETCH_CARDS = 2
 
 class GenreRow(QWidget):
     """
     Widget representing a genre section with horizontal scrolling.
-    
-    Displays movies organized by genre with Netflix-style horizontal scrolling layout.
-    
+
+    Displays movies organized by genre with Netflix-style horizontal
+    scrolling layout. Card widgets are created lazily: every movie gets a
+    lightweight fixed-size placeholder up front, and the real FilmCard is
+    only built when its slot scrolls into (or near) the viewport.
+
     Attributes:
         genre_name (str): Name of the genre
         movies (list): List of Movie objects to display
         user_manager: User manager instance for handling user interactions
-        cards (list): List of MovieCard widgets in this row
+        cards (list): List of FilmCard widgets materialized so far
     """
-    
+
+    # Signal emitted when a card is lazily created (FilmCard instance)
+    card_created = pyqtSignal(object)
+
     def __init__(self, genre_name, movies, user_manager=None, parent=None):
         """
         Initialize a genre row.
-        
+
         Args:
             genre_name (str): Name of the genre
             movies (list): List of Movie objects to display
@@ -34,30 +49,33 @@ class GenreRow(QWidget):
         self.genre_name = genre_name
         self.movies = movies
         self.user_manager = user_manager
-        self.cards = []  # List to store movie cards
+        self.cards = []  # Cards materialized so far
+        self._slots = []  # One [movie, placeholder, card] entry per movie
         self.setup_ui()
-    
+
     def get_cards(self):
         """
-        Return the list of movie cards in this row.
-        
+        Return the list of movie cards materialized so far.
+
+        Cards created later are announced through the card_created signal.
+
         Returns:
-            list: List of MovieCard widgets
+            list: List of FilmCard widgets
         """
         return self.cards
-    
+
     def setup_ui(self):
         """Configure the genre row interface."""
         # Main vertical layout with more spacing
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 12, 20, 12)  # Increased margins
         main_layout.setSpacing(12)  # More space between title and cards
-        
+
         # Header with genre name
         genre_label = QLabel(self.genre_name)
         genre_label.setObjectName("genreHeader")
         main_layout.addWidget(genre_label)
-        
+
         # Scroll area for movie cards (updated for vertical poster format)
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -67,38 +85,101 @@ class GenreRow(QWidget):
         scroll_area.setObjectName("genreScrollArea")
         scroll_area.setMinimumHeight(435)
         scroll_area.setMaximumHeight(435)
-        
+
         # Force scroll area to expand horizontally
         scroll_area.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
+
         # Container widget for cards
         cards_container = QWidget()
         cards_container.setObjectName("cardsContainer")
         cards_layout = QHBoxLayout(cards_container)
         cards_layout.setContentsMargins(8, 0, 8, 0)  # Small horizontal padding
-        cards_layout.setSpacing(16)  # More spacing between cards
+        cards_layout.setSpacing(CARD_SPACING)  # More spacing between cards
         cards_layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        
+
         # Shuffle movies for variety in display order
         shuffled_movies = self.movies.copy()
         random.shuffle(shuffled_movies)
-        
-        # Add movie cards
+
+        # Add a cheap fixed-size placeholder per movie; the FilmCard itself
+        # is only created when the slot approaches the viewport
         for movie in shuffled_movies:
-            card_widget = createFilmCard(movie, self.user_manager)
-            self.cards.append(card_widget)
-            cards_layout.addWidget(card_widget)
-        
+            placeholder = QFrame()
+            placeholder.setObjectName("cardSlot")
+            placeholder.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
+            slot_layout = QVBoxLayout(placeholder)
+            slot_layout.setContentsMargins(0, 0, 0, 0)
+            slot_layout.setSpacing(0)
+            cards_layout.addWidget(placeholder)
+            self._slots.append([movie, placeholder, None])
+
         # Add stretch at the end to prevent card stretching
         cards_layout.addStretch()
-        
+
         # Configure the scroll area
         scroll_area.setWidget(cards_container)
         main_layout.addWidget(scroll_area)
-        
+
+        self._scroll_area = scroll_area
+        scroll_area.horizontalScrollBar().valueChanged.connect(
+            self._materialize_visible_cards
+        )
+
         # Widget style and size (updated for taller cards + scrollbar)
         self.setObjectName("genreRow")
         self.setMinimumHeight(485)  # Increased total height for scrollbar space
-        
+
         # Force GenreRow to expand horizontally to fill parent
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+    def showEvent(self, event):
+        """Materialize the initially visible cards on first show."""
+        super().showEvent(event)
+        self._materialize_visible_cards()
+
+    def resizeEvent(self, event):
+        """A wider viewport may expose slots that need materializing."""
+        super().resizeEvent(event)
+        self._materialize_visible_cards()
+
+    def _materialize_visible_cards(self):
+        """Create FilmCards for every slot in or near the viewport."""
+        if not self._slots:
+            return
+
+        # Rows scrolled out of the main (vertical) viewport keep their
+        # placeholders; the owning view re-triggers this on scroll
+        if self.visibleRegion().isEmpty():
+            return
+
+        stride = CARD_WIDTH + CARD_SPACING
+        bar = self._scroll_area.horizontalScrollBar()
+        viewport_width = self._scroll_area.viewport().width()
+        if viewport_width <= 0:
+            viewport_width = self.width()
+
+        first = max(0, bar.value() // stride - PREFETCH_CARDS)
+        last = min(len(self._slots) - 1,
+                   (bar.value() + viewport_width) // stride + PREFETCH_CARDS)
+
+        with ConnectionQueue():
+            for index in range(first, last + 1):
+                self._materialize_card(index)
+
+    def _materialize_card(self, index):
+        """
+        Create the FilmCard for a slot if it doesn't exist yet.
+
+        Args:
+            index (int): Slot index in display order
+        """
+        slot = self._slots[index]
+        movie, placeholder, card = slot
+        if card is not None:
+            return
+
+        card = createFilmCard(movie, self.user_manager)
+        slot[2] = card
+        placeholder.layout().addWidget(card)
+        self.cards.append(card)
+        self.card_created.emit(card)